@@ -54,6 +54,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         name=DOMAIN,
         update_method=_async_update_method,
         update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        always_update=False,
     )
 
     await coordinator.async_config_entry_first_refresh()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
+from types import MappingProxyType
 
 from homeassistant import config_entries
 from homeassistant.components.sensor import (
@@ -19,11 +21,10 @@ from homeassistant.const import (
     UnitOfElectricPotential,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -34,78 +35,79 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-SENSORS_MAPPING_TEMPLATE: dict[str, SensorEntityDescription] = {
-    "EC": SensorEntityDescription(
-        key="EC",
-        name="Electrical Conductivity",
-        native_unit_of_measurement=UnitOfConductivity.MICROSIEMENS_PER_CM,
-        state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:flash-triangle-outline",
-        suggested_display_precision=0,
-    ),
-    "salt": SensorEntityDescription(
-        key="salt",
-        name="Salt",
-        native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-        state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:shaker-outline",
-    ),
-    "ORP": SensorEntityDescription(
-        key="ORP",
-        name="Oxidation-Reduction Potential",
-        native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        icon="mdi:alpha-v-circle",
-        suggested_display_precision=0,
-    ),
-    "pH": SensorEntityDescription(
-        key="pH",
-        name="pH",
-        device_class=SensorDeviceClass.PH,
-        state_class=SensorStateClass.MEASUREMENT,
-        icon="mdi:ph",
-        suggested_display_precision=1,
-    ),
-    "battery": SensorEntityDescription(
-        key="battery",
-        name="Battery",
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.BATTERY,
-        native_unit_of_measurement=PERCENTAGE,
-        icon="mdi:battery",
-        suggested_display_precision=0,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    "battery_voltage": SensorEntityDescription(
-        key="battery_voltage",
-        name="Battery Voltage",
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.VOLTAGE,
-        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        icon="mdi:battery",
-        suggested_display_precision=2,
-        entity_category=EntityCategory.DIAGNOSTIC,
-    ),
-    "temperature": SensorEntityDescription(
-        key="temperature",
-        name="Temperature",
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        icon="mdi:pool-thermometer",
-        suggested_display_precision=2,
-    ),
-    "chlorine": SensorEntityDescription(
-        key="chlorine",
-        name="Free Chlorine",
-        state_class=SensorStateClass.MEASUREMENT,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-        icon="mdi:chemical-weapon",
-        suggested_display_precision=2,
-    ),
-}
+SENSORS_MAPPING_TEMPLATE: Mapping[str, SensorEntityDescription] = MappingProxyType(
+    {
+        "EC": SensorEntityDescription(
+            key="EC",
+            name="Electrical Conductivity",
+            native_unit_of_measurement=UnitOfConductivity.MICROSIEMENS_PER_CM,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:flash-triangle-outline",
+            suggested_display_precision=0,
+        ),
+        "salt": SensorEntityDescription(
+            key="salt",
+            name="Salt",
+            native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:shaker-outline",
+        ),
+        "ORP": SensorEntityDescription(
+            key="ORP",
+            name="Oxidation-Reduction Potential",
+            native_unit_of_measurement=UnitOfElectricPotential.MILLIVOLT,
+            state_class=SensorStateClass.MEASUREMENT,
+            device_class=SensorDeviceClass.VOLTAGE,
+            icon="mdi:alpha-v-circle",
+            suggested_display_precision=0,
+        ),
+        "pH": SensorEntityDescription(
+            key="pH",
+            name="pH",
+            device_class=SensorDeviceClass.PH,
+            state_class=SensorStateClass.MEASUREMENT,
+            icon="mdi:ph",
+            suggested_display_precision=1,
+        ),
+        "battery": SensorEntityDescription(
+            key="battery",
+            name="Battery",
+            state_class=SensorStateClass.MEASUREMENT,
+            device_class=SensorDeviceClass.BATTERY,
+            native_unit_of_measurement=PERCENTAGE,
+            icon="mdi:battery",
+            suggested_display_precision=0,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "battery_voltage": SensorEntityDescription(
+            key="battery_voltage",
+            name="Battery Voltage",
+            state_class=SensorStateClass.MEASUREMENT,
+            device_class=SensorDeviceClass.VOLTAGE,
+            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+            icon="mdi:battery",
+            suggested_display_precision=2,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+        "temperature": SensorEntityDescription(
+            key="temperature",
+            name="Temperature",
+            state_class=SensorStateClass.MEASUREMENT,
+            device_class=SensorDeviceClass.TEMPERATURE,
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            icon="mdi:pool-thermometer",
+            suggested_display_precision=2,
+        ),
+        "chlorine": SensorEntityDescription(
+            key="chlorine",
+            name="Free Chlorine",
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
+            icon="mdi:chemical-weapon",
+            suggested_display_precision=2,
+        ),
+    }
+)
 
 
 async def async_setup_entry(
@@ -118,24 +120,48 @@ async def async_setup_entry(
     coordinator: DataUpdateCoordinator[BlueConnectGoDevice] = hass.data[DOMAIN][
         entry.entry_id
     ]
-    sensors_mapping = SENSORS_MAPPING_TEMPLATE.copy()
-    entities = []
-    _LOGGER.debug("got sensors: %s", coordinator.data.sensors)
-    for sensor_type, sensor_value in coordinator.data.sensors.items():
-        if sensor_type not in sensors_mapping:
-            _LOGGER.debug(
-                "Unknown sensor type detected: %s, %s",
-                sensor_type,
-                sensor_value,
-            )
-            continue
-        entities.append(
+    blueconnect_go_device = coordinator.data
+    device_name = f"{blueconnect_go_device.name} {blueconnect_go_device.identifier}"
+    device_info = DeviceInfo(
+        connections=frozenset(
+            ((CONNECTION_BLUETOOTH, blueconnect_go_device.address),)
+        ),
+        name=device_name,
+        manufacturer="Blue Riiot",
+        model="Blue Connect Go",
+        hw_version=blueconnect_go_device.hw_version,
+        sw_version=blueconnect_go_device.sw_version,
+    )
+
+    sensors = blueconnect_go_device.sensors
+    _LOGGER.debug("got sensors: %s", sensors)
+    if unknown := sensors.keys() - SENSORS_MAPPING_TEMPLATE.keys():
+        _LOGGER.debug("Unknown sensor types detected: %s", unknown)
+
+    created_keys: set[str] = set()
+
+    @callback
+    def _async_add_new_sensors() -> None:
+        """Add entities for known sensor types not seen in earlier polls."""
+        new_keys = (
+            SENSORS_MAPPING_TEMPLATE.keys() & coordinator.data.sensors.keys()
+        ) - created_keys
+        if not new_keys:
+            return
+        created_keys.update(new_keys)
+        async_add_entities(
             BlueConnectSensor(
-                coordinator, coordinator.data, sensors_mapping[sensor_type]
+                coordinator,
+                coordinator.data,
+                SENSORS_MAPPING_TEMPLATE[key],
+                device_name,
+                device_info,
             )
+            for key in new_keys
         )
 
-    async_add_entities(entities)
+    _async_add_new_sensors()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_sensors))
 
 
 class BlueConnectSensor(
@@ -151,34 +177,23 @@ class BlueConnectSensor(
         coordinator: DataUpdateCoordinator,
         blueconnect_go_device: BlueConnectGoDevice,
         entity_description: SensorEntityDescription,
+        device_name: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Populate the BlueConnect Go entity with relevant data."""
         super().__init__(coordinator)
         self.entity_description = entity_description
+        self._key = entity_description.key
 
-        name = f"{blueconnect_go_device.name} {blueconnect_go_device.identifier}"
-
-        self._attr_unique_id = f"{name}_{entity_description.key}"
+        self._attr_unique_id = f"{device_name}_{entity_description.key}"
 
         self._id = blueconnect_go_device.address
-        self._attr_device_info = DeviceInfo(
-            connections={
-                (
-                    CONNECTION_BLUETOOTH,
-                    blueconnect_go_device.address,
-                )
-            },
-            name=name,
-            manufacturer="Blue Riiot",
-            model="Blue Connect Go",
-            hw_version=blueconnect_go_device.hw_version,
-            sw_version=blueconnect_go_device.sw_version,
-        )
+        self._attr_device_info = device_info
+
+        self._attr_native_value = blueconnect_go_device.sensors.get(self._key)
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the value reported by the sensor."""
-        try:
-            return self.coordinator.data.sensors[self.entity_description.key]
-        except KeyError:
-            return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Store the latest value reported by the sensor."""
+        self._attr_native_value = self.coordinator.data.sensors.get(self._key)
+        super()._handle_coordinator_update()